@@ -1,8 +1,10 @@
 import shutil
+from functools import lru_cache
 from pathlib import Path
 import time
 
 
+@lru_cache(maxsize=1)
 def get_data_path() -> Path:
     # if the working directory is alread ml_drought don't need ../data
     if "/home/tommy" in Path(".").absolute().as_posix():
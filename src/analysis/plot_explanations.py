@@ -28,6 +28,19 @@ int2month = {
 }
 
 
+def _get_normalizing_key(
+    value_to_plot: str, normalizing_dict: Dict[str, Dict[str, float]]
+) -> Optional[str]:
+    """Find the key in the normalizing dict for value_to_plot. The input
+    variable names may carry a prefix, so if there isn't an
+    exact match the longest key which value_to_plot ends with is used.
+    """
+    if value_to_plot in normalizing_dict:
+        return value_to_plot
+    matches = [key for key in normalizing_dict if value_to_plot.endswith(key)]
+    return max(matches, key=len) if len(matches) > 0 else None
+
+
 def plot_explanations(
     x: np.ndarray,
     explanations: np.ndarray,
@@ -76,27 +89,22 @@ def plot_explanations(
     x_val = x[:, idx]
 
     # we also want to denormalize
-    for norm_var in normalizing_dict.keys():
-        if value_to_plot.endswith(norm_var):
-            x_val = (x_val * normalizing_dict[norm_var]["std"]) + normalizing_dict[
-                norm_var
-            ]["mean"]
-            break
+    norm_var = _get_normalizing_key(value_to_plot, normalizing_dict)
+    if norm_var is not None:
+        # x_val is a view into x, so only the multiplication allocates
+        x_val = x_val * normalizing_dict[norm_var]["std"]
+        x_val += normalizing_dict[norm_var]["mean"]
 
     expl_val = explanations[:, idx]
 
     months = list(range(1, len(x_val) + 1))
 
     if pred_date is not None:
-        int_months, int_years = [], []
-        cur_month, cur_year = pred_date[0], pred_date[1]
-        for i in range(1, len(x_val) + 1):
-            cur_month = cur_month - 1
-            if cur_month == 0:
-                cur_month = 12
-                cur_year -= 1
-            int_months.append(cur_month)
-            int_years.append(cur_year)
+        # count months from year 0 so that stepping back is a subtraction
+        month_counts = (
+            pred_date[1] * 12 + (pred_date[0] - 1) - np.arange(1, len(x_val) + 1)
+        )
+        int_months, int_years = month_counts % 12 + 1, month_counts // 12
         str_dates = [f"{int2month[m]}{y}" for m, y in zip(int_months, int_years)][::-1]
 
     host = host_subplot(111, axes_class=AA.Axes, figure=fig)
@@ -227,7 +227,7 @@ class RegionGeoPlotter:
         **kwargs: Dict,
     ) -> Tuple[Figure, List[Axes]]:
         """Plot area-based maps of the scores"""
-        assert np.isin(["rmse", "mae", "r2"], gdf.columns).all()  # type: ignore
+        assert {"rmse", "mae", "r2"} <= set(gdf.columns)  # type: ignore
         gdf = gdf.dropna(subset=["rmse", "mae", "r2"])  # type: ignore
 
         # get the PlotMetric objects
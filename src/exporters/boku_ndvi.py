@@ -19,8 +19,8 @@ and copy the ftp links to `./etc/conda/activate.d/env_vars.sh`
 import os
 from pathlib import Path
 import urllib.request
-import xarray as xr
 import shutil
+import multiprocessing
 
 from typing import List
 
@@ -28,6 +28,12 @@ from .base import BaseExporter
 
 gdal = None
 BeautifulSoup = None
+netCDF4 = None
+
+# GDAL configuration used when converting the tifs. The tifs folder holds
+# thousands of files, so GDAL is stopped from listing it (looking for
+# sidecar files) every time a tif is opened
+GDAL_CONFIG_OPTIONS = {"GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR"}
 
 
 class BokuNDVIExporter(BaseExporter):
@@ -45,6 +51,9 @@ class BokuNDVIExporter(BaseExporter):
         global BeautifulSoup
         if BeautifulSoup is None:
             from bs4 import BeautifulSoup
+        global netCDF4
+        if netCDF4 is None:
+            import netCDF4
 
         self.resolution = str(resolution)
         if self.resolution == "1000":
@@ -77,13 +86,9 @@ class BokuNDVIExporter(BaseExporter):
         # use BeautifulSoup to parse the html source
         page = str(BeautifulSoup(the_page, features="lxml"))  # type: ignore
 
-        # split the page to get the filenames as a list
-        firstsplit = page.split("\r\n")  # split the newlines
-        secondsplit = [x.split(" ") for x in firstsplit]  # split the spaces
-        flatlist = [item for sublist in secondsplit for item in sublist]  # flatten
-
-        # get the name of the files by the identifying_string
-        files = [f for f in flatlist if identifying_string in f]
+        # split the page on whitespace (newlines and spaces) in a single pass,
+        # and get the name of the files by the identifying_string
+        files = [f for f in page.split() if identifying_string in f]
         return files
 
     @staticmethod
@@ -101,16 +106,37 @@ class BokuNDVIExporter(BaseExporter):
             )
 
     @staticmethod
-    def tif_to_nc(tif_file: Path, nc_file: Path) -> None:
-        """convert .tif -> .nc using GDAL"""
-        ds = gdal.Open(tif_file.resolve().as_posix())  # type: ignore
-        _ = gdal.Translate(  # type: ignore
-            format="NetCDF",
-            srcDS=ds,  # type: ignore
-            destName=nc_file.resolve().as_posix(),
-        )
+    def tif_to_nc(tif_file: Path, nc_file: Path, complevel: int = 1) -> None:
+        """convert .tif -> .nc using GDAL
+
+        The netcdf file is written in the (chunked) netcdf4 classic format,
+        deflated with the zlib `complevel`
+        """
+        # GDAL config options are process wide, so they are only set for the
+        # conversion and the previous values are restored afterwards
+        previous_options = {
+            key: gdal.GetConfigOption(key)  # type: ignore
+            for key in GDAL_CONFIG_OPTIONS
+        }
+        for key, value in GDAL_CONFIG_OPTIONS.items():
+            gdal.SetConfigOption(key, value)  # type: ignore
+        try:
+            ds = gdal.Open(tif_file.resolve().as_posix())  # type: ignore
+            _ = gdal.Translate(  # type: ignore
+                format="NetCDF",
+                srcDS=ds,  # type: ignore
+                destName=nc_file.resolve().as_posix(),
+                creationOptions=[
+                    "FORMAT=NC4C",
+                    "COMPRESS=DEFLATE",
+                    f"ZLEVEL={complevel}",
+                ],
+            )
+        finally:
+            for key, value in previous_options.items():
+                gdal.SetConfigOption(key, value)  # type: ignore
 
-    def export(self, region_name: str = "kenya") -> None:
+    def export(self, region_name: str = "kenya", n_parallel_processes: int = 1) -> None:
         """
         Export BOKU processed MODIS NDVI data
 
@@ -119,6 +145,8 @@ class BokuNDVIExporter(BaseExporter):
         region_name: str = 'kenya'
             The region to download. Must be one of the regions in the
             region_lookup dictionary
+        n_parallel_processes: int = 1
+            The number of processes used to convert the .tif files to netcdf
         """
 
         identifying_string = ".tif"
@@ -141,40 +169,54 @@ class BokuNDVIExporter(BaseExporter):
         dst_tif_files = [dst_dir / f.name for f in tif_files]
 
         for src, dst in zip(tif_files, dst_tif_files):
-            shutil.move(src, dst)
-
-        # 3. convert from tif to netcdf
-        tif_files = [f for f in self.output_folder.glob("tifs/*.tif")]
+            # dst_dir is inside the output folder, so a rename is usually
+            # enough. shutil.move copies when the rename fails
+            try:
+                os.replace(src, dst)
+            except OSError:
+                shutil.move(src, dst)
+
+        # 3. convert from tif to netcdf, skipping tifs converted by a previous run
+        # the moved files are already known, so there is no need to rescan dst_dir
+        converted = {f.stem for f in self.output_folder.glob("*.nc")}
+        tif_files = [f for f in sorted(dst_tif_files) if f.stem not in converted]
         TMP_nc_files = [f.parents[1] / (f.stem + "_TMP.nc") for f in tif_files]
         nc_files = [f.parents[1] / (f.stem + ".nc") for f in tif_files]
-        tif_files.sort()
-        TMP_nc_files.sort()
-        nc_files.sort()
 
         print("\n")
-        for tif_file, nc_file in zip(tif_files, TMP_nc_files):
-            self.tif_to_nc(tif_file, nc_file)
-            print(f"-- Converted {tif_file.name} to netcdf --")
+        if n_parallel_processes > 1:
+            # each conversion reads and writes its own files
+            pool = multiprocessing.Pool(processes=n_parallel_processes)
+            pool.starmap(self.tif_to_nc, zip(tif_files, TMP_nc_files))
+            pool.close()
+            pool.join()
+            print(f"-- Converted {len(tif_files)} tifs to netcdf --")
+        else:
+            for tif_file, nc_file in zip(tif_files, TMP_nc_files):
+                self.tif_to_nc(tif_file, nc_file)
+                print(f"-- Converted {tif_file.name} to netcdf --")
 
         # 4. rename BAND1 to rename_str
         rename_str = "boku_ndvi"
 
-        # get the newly created nc files
-        TMP_nc_files = [f for f in self.output_folder.glob("*TMP.nc")]
-        TMP_nc_files.sort()
-
-        assert TMP_nc_files != [], "Should have created TMP netcdf files"
+        assert all(
+            f.exists() for f in TMP_nc_files
+        ), "Should have created TMP netcdf files"
 
         print("\n")
         for tmp_file, nc_file in zip(TMP_nc_files, nc_files):
             if not nc_file.exists():
-                ds = xr.open_dataset(tmp_file).rename(dict(Band1=rename_str))
-                da = ds[rename_str]
-                da.to_netcdf(nc_file)
+                # renaming the variable only rewrites the file header, so there
+                # is no need to read and rewrite the data through xarray
+                with netCDF4.Dataset(tmp_file, "a") as nc:  # type: ignore
+                    nc.renameVariable("Band1", rename_str)
+                os.replace(tmp_file, nc_file)
                 print(f"-- Renamed Band1 in {nc_file.name} to {rename_str} --")
             else:
                 print(f"-- {nc_file.name} already exists! --")
 
         # 5. remove temporary netcdf files
-        [f.unlink() for f in TMP_nc_files]  # type: ignore
+        for tmp_file in TMP_nc_files:
+            if tmp_file.exists():
+                tmp_file.unlink()
         print("Removed *TMP.nc files")
@@ -2,14 +2,20 @@ from pathlib import Path
 import warnings
 import re
 from pprint import pprint
-import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional, List, cast
+from typing import Dict, Optional, List
 
 from .base import BaseExporter, Region, region_lookup
 
 cdsapi = None
 
+# the time-related arguments of the ERA5 selection requests, built once at import
+_MONTHS = tuple("{:02d}".format(month) for month in range(1, 12 + 1))
+_DAYS = tuple("{:02d}".format(day) for day in range(1, 31 + 1))
+_TIMES = tuple("{:02d}:00".format(hour) for hour in range(24))
+_ERA5_YEARS = tuple(str(year) for year in range(1979, 2019 + 1))
+
 
 class CDSExporter(BaseExporter):
     """Exports for the Climate Data Store
@@ -97,18 +103,18 @@ class CDSExporter(BaseExporter):
             A dictionary with all the time-related arguments of the
             selection dict filled out
         """
-        months = ["{:02d}".format(month) for month in range(1, 12 + 1)]
-        days = ["{:02d}".format(day) for day in range(1, 31 + 1)]
-        times = ["{:02d}:00".format(hour) for hour in range(24)]
-
         if land:  # era5 land
             years = [str(year) for year in range(1981, datetime.now().year + 1)]
         else:  # era5
             years = [str(year) for year in range(1979, datetime.now().year + 1)]
 
-        selection_dict = {"year": years, "month": months, "time": times}
+        return CDSExporter._make_time_selection(years, granularity)
+
+    @staticmethod
+    def _make_time_selection(years: List[str], granularity: str = "hourly") -> Dict:
+        selection_dict = {"year": years, "month": list(_MONTHS), "time": list(_TIMES)}
         if granularity == "hourly":
-            selection_dict["day"] = days
+            selection_dict["day"] = list(_DAYS)
         return selection_dict
 
     @staticmethod
@@ -133,17 +139,17 @@ class CDSExporter(BaseExporter):
         """
         dataset_folder = self.raw_folder / dataset
         if not dataset_folder.exists():
-            dataset_folder.mkdir()
+            dataset_folder.mkdir(exist_ok=True)
 
         variables = "_".join(selection_request["variable"])
         variables_folder = dataset_folder / variables
         if not variables_folder.exists():
-            variables_folder.mkdir()
+            variables_folder.mkdir(exist_ok=True)
 
         years = self._filename_from_selection_request(selection_request["year"], "year")
         years_folder = variables_folder / years
         if not years_folder.exists():
-            years_folder.mkdir()
+            years_folder.mkdir(exist_ok=True)
 
         months = self._filename_from_selection_request(
             selection_request["month"], "month"
@@ -202,6 +208,31 @@ class CDSExporter(BaseExporter):
 
         return output_file
 
+    def _export_parallel(
+        self,
+        dataset: str,
+        selection_requests: List[Dict],
+        show_api_request: bool = False,
+        n_parallel_requests: int = 2,
+    ) -> List[Path]:
+        """Export a list of CDS requests in parallel. The requests are
+        network bound, so threads are used instead of processes; each
+        request still gets its own `cdsapi.Client` (see `_export`).
+
+        Returns
+        ----------
+        output_files: List of pathlib.Paths
+            The locations of the exported data, in the order of `selection_requests`
+        """
+        with ThreadPoolExecutor(max_workers=int(n_parallel_requests)) as executor:
+            output_files = executor.map(
+                lambda request: self._export(
+                    dataset, request, show_api_request, in_parallel=True
+                ),
+                selection_requests,
+            )
+            return list(output_files)
+
 
 class ERA5Exporter(CDSExporter):
     """Exports ERA5 data from the Climate Data Store
@@ -225,15 +256,7 @@ class ERA5Exporter(CDSExporter):
             A dictionary with all the time-related arguments of the
             selection dict filled out
         """
-        years = [str(year) for year in range(1979, 2019 + 1)]
-        months = ["{:02d}".format(month) for month in range(1, 12 + 1)]
-        days = ["{:02d}".format(day) for day in range(1, 31 + 1)]
-        times = ["{:02d}:00".format(hour) for hour in range(24)]
-
-        selection_dict = {"year": years, "month": months, "time": times}
-        if granularity == "hourly":
-            selection_dict["day"] = days
-        return selection_dict
+        return CDSExporter._make_time_selection(list(_ERA5_YEARS), granularity)
 
     @staticmethod
     def get_dataset(variable: str, granularity: str = "hourly") -> str:
@@ -362,29 +385,20 @@ class ERA5Exporter(CDSExporter):
 
         # break up by year
         if break_up:
-            if n_parallel_requests > 1:  # Run in parallel
-                p = multiprocessing.Pool(int(n_parallel_requests))
-
-            output_paths = []
+            updated_requests = []
             for year in processed_selection_request["year"]:
                 updated_request = processed_selection_request.copy()
                 updated_request["year"] = [year]
+                updated_requests.append(updated_request)
 
-                if n_parallel_requests > 1:  # Run in parallel
-                    # multiprocessing of the paths
-                    output_paths.append(
-                        p.apply_async(
-                            self._export,
-                            args=(dataset, updated_request, show_api_request, True),
-                        )
-                    )
-                else:  # run sequentially
-                    output_paths.append(  # type: ignore
-                        self._export(dataset, updated_request, show_api_request)
-                    )
-            if n_parallel_requests > 1:
-                p.close()
-                p.join()
-            return cast(List[Path], output_paths)
+            if n_parallel_requests > 1:  # Run in parallel
+                return self._export_parallel(
+                    dataset, updated_requests, show_api_request, n_parallel_requests
+                )
+            # run sequentially
+            return [
+                self._export(dataset, updated_request, show_api_request)
+                for updated_request in updated_requests
+            ]
 
         return [self._export(dataset, processed_selection_request, show_api_request)]
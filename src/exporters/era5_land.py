@@ -1,7 +1,6 @@
 from pathlib import Path
-from typing import Optional, Dict, List, cast, Any
+from typing import Optional, Dict, List
 import warnings
-import multiprocessing
 import itertools
 
 from .cds import CDSExporter
@@ -115,34 +114,6 @@ class ERA5LandExporter(CDSExporter):
                 ]
         return processed_selection_request
 
-    def _broken_export(
-        self,
-        updated_request: Dict,
-        dataset: str,
-        output_paths: List,
-        show_api_request: bool = True,
-        n_parallel_requests: int = 1,
-        pool: Optional[Any] = None,  #  multiprocessing
-    ) -> List:
-        if n_parallel_requests > 1:  # Run in parallel
-            assert pool is not None, (
-                "`p` argument (multiprocessing.Pool)"
-                " must be provided for n_parallel_requests > 1"
-            )
-            # multiprocessing of the paths
-            output_paths.append(
-                pool.apply_async(
-                    self._export,
-                    args=(dataset, updated_request, show_api_request, True),
-                )
-            )
-        else:  # run sequentially
-            output_paths.append(  # type: ignore
-                self._export(dataset, updated_request, show_api_request)
-            )
-
-        return output_paths
-
     def export(
         self,
         variable: str,
@@ -173,7 +144,10 @@ class ERA5LandExporter(CDSExporter):
         parallel: bool, default = True
             Whether to download data in parallel
         n_parallel_requests:
-            How many parallel requests to the CDSAPI to make
+            How many parallel requests to the CDSAPI to make. When requests are
+            broken up yearly and made sequentially, a failed year is reported and
+            skipped; in parallel (n_parallel_requests > 1), any failed request
+            raises its exception once the other requests have finished
 
         Returns:
         -------
@@ -200,15 +174,13 @@ class ERA5LandExporter(CDSExporter):
         if n_parallel_requests < 1:
             n_parallel_requests = 1
 
-        p: Optional[Any]  #  multiprocessing.Pool
-        if n_parallel_requests > 1:  # Run in parallel
-            p = multiprocessing.Pool(int(n_parallel_requests))
-        else:
-            p = None
+        if break_up is None:
+            return [
+                self._export(dataset, processed_selection_request, show_api_request)
+            ]
 
-        # break up by month
+        updated_requests = []
         if break_up == "monthly":
-            output_paths: List[Path] = []
             for year, month in itertools.product(
                 processed_selection_request["year"],
                 processed_selection_request["month"],
@@ -216,48 +188,34 @@ class ERA5LandExporter(CDSExporter):
                 updated_request = processed_selection_request.copy()
                 updated_request["year"] = [year]
                 updated_request["month"] = [month]
-                output_paths = self._broken_export(
-                    updated_request=updated_request,
-                    dataset=dataset,
-                    output_paths=output_paths,
-                    show_api_request=show_api_request,
-                    n_parallel_requests=n_parallel_requests,
-                    pool=p,
-                )
-
-            if n_parallel_requests > 1:
-                assert p is not None
-                p.close()
-                p.join()
-            return cast(List[Path], output_paths)
-
-        if break_up == "yearly":
-            output_paths = []
+                updated_requests.append(updated_request)
+        else:  # break up by year
             for year in processed_selection_request["year"]:
                 updated_request = processed_selection_request.copy()
                 updated_request["year"] = [year]
-                try:
-                    output_paths = self._broken_export(
-                        updated_request=updated_request,
-                        dataset=dataset,
-                        output_paths=output_paths,
-                        show_api_request=show_api_request,
-                        n_parallel_requests=n_parallel_requests,
-                        pool=p,
-                    )
-                except KeyboardInterrupt:
-                    raise
-                except Exception as E:
-                    print(f"\n\n**{year} Failed **")
-                    print(E)
-                    print("\nRequest:")
-                    print(updated_request)
-                    print("\n\n")
+                updated_requests.append(updated_request)
 
-            if n_parallel_requests > 1:
-                assert p is not None
-                p.close()
-                p.join()
-            return cast(List[Path], output_paths)
+        if n_parallel_requests > 1:  # Run in parallel
+            return self._export_parallel(
+                dataset, updated_requests, show_api_request, n_parallel_requests
+            )
 
-        return [self._export(dataset, processed_selection_request, show_api_request)]
+        # run sequentially
+        output_paths: List[Path] = []
+        for updated_request in updated_requests:
+            try:
+                output_paths.append(
+                    self._export(dataset, updated_request, show_api_request)
+                )
+            except KeyboardInterrupt:
+                raise
+            except Exception as E:
+                if break_up == "monthly":
+                    raise
+                # failed years are reported and skipped
+                print(f"\n\n**{updated_request['year'][0]} Failed **")
+                print(E)
+                print("\nRequest:")
+                print(updated_request)
+                print("\n\n")
+        return output_paths
@@ -1,14 +1,25 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from itertools import product
 from pathlib import Path
 import warnings
 
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from .base import BaseExporter
 
-boto3 = None
-botocore = None
-Config = None
+
+@lru_cache(maxsize=None)
+def _lazy_imports():
+    """boto3 is only needed by this exporter, so it is imported
+    (once) when the first exporter is created
+    """
+    import boto3
+    import botocore
+    from botocore.client import Config
+    from boto3.s3.transfer import TransferConfig
+
+    return boto3, botocore, Config, TransferConfig
 
 
 class ERA5ExporterPOS(BaseExporter):
@@ -22,33 +33,45 @@ class ERA5ExporterPOS(BaseExporter):
     def __init__(self, data_folder: Path = Path("data")) -> None:
         super().__init__(data_folder)
 
-        global boto3
-        if boto3 is None:
-            import boto3
-        global botocore
-        global Config
-        if botocore is None:
-            import botocore
-            from botocore.client import Config
+        _, botocore, _, TransferConfig = _lazy_imports()
+        self._client_error = botocore.exceptions.ClientError
+
+        # the monthly files are hundreds of MB to GBs. The boto3 defaults (8MB
+        # parts over 10 threads) mean over a hundred part requests per file, so
+        # fewer, larger parts are fetched over more threads
+        self.transfer_config = TransferConfig(
+            multipart_chunksize=32 * 1024 * 1024, max_concurrency=20
+        )
 
         self.era5_bucket = "era5-pds"
-        self.client = boto3.client(  # type: ignore
+        self.client = self._make_client()
+
+    def _make_client(self, n_parallel_requests: int = 1):
+        """Make an (unsigned) S3 client whose connection pool is large enough
+        for every download thread (n_parallel_requests files, each downloaded
+        over max_concurrency threads), so connections aren't discarded and reopened
+        """
+        boto3, botocore, Config, _ = _lazy_imports()
+        max_connections = n_parallel_requests * self.transfer_config.max_concurrency
+        return boto3.client(
             "s3",
-            config=Config(  # type: ignore
-                signature_version=botocore.UNSIGNED
+            config=Config(
+                signature_version=botocore.UNSIGNED,
+                max_pool_connections=max_connections,
             ),
         )
 
     def get_variables(self, year: int, month: int) -> List[str]:
         target_prefix = f"{year}/{month:02d}/data"
 
-        files = self.client.list_objects_v2(
-            Bucket=self.era5_bucket, Prefix=target_prefix
-        )
+        # list_objects_v2 returns at most 1000 keys per call, so paginate
+        paginator = self.client.get_paginator("list_objects_v2")
+        result = paginator.paginate(Bucket=self.era5_bucket, Prefix=target_prefix)
         variables = []
-        for file in files["Contents"]:
-            key = file["Key"].split("/")[-1].replace(".nc", "")
-            variables.append(key)
+        for page in result:
+            for file in page.get("Contents", []):
+                key = file["Key"].split("/")[-1].replace(".nc", "")
+                variables.append(key)
 
         return variables
 
@@ -76,11 +99,47 @@ class ERA5ExporterPOS(BaseExporter):
                 continue
         return years
 
+    def _export_file(
+        self,
+        year: int,
+        month: int,
+        target_key: str,
+        target_output: Path,
+        *,
+        client: Optional[Any] = None,
+    ) -> Optional[Path]:
+        """Download a single key from the bucket, returning None
+        if the key does not exist. If no client is passed, self.client is used
+        """
+        if client is None:
+            client = self.client
+        try:
+            client.download_file(
+                self.era5_bucket,
+                target_key,
+                str(target_output),
+                Config=self.transfer_config,
+            )
+            print(f"Exported {target_key} to {target_output.parent}")
+            return target_output
+        except self._client_error as e:
+            if e.response["Error"]["Code"] == "404":
+                possible_variables = self.get_variables(year, month)
+                possible_variables_str = "\n".join(possible_variables)
+                warnings.warn(
+                    f"Key does not exist! "
+                    f"Possible variables are: {possible_variables_str}"
+                )
+                return None
+            else:
+                raise e
+
     def export(
         self,
         variable: str,
         years: Optional[List[int]] = None,
         months: Optional[List[int]] = None,
+        n_parallel_requests: int = 1,
     ) -> List[Path]:
         """Export data from Planet OS's S3 bucket
 
@@ -92,6 +151,9 @@ class ERA5ExporterPOS(BaseExporter):
             The years of data to download
         months: list of ints, or None, default = None
             The months of data to download
+        n_parallel_requests: int, default = 1
+            How many files to download from the bucket at once. The downloads are
+            network bound, so they are run in a thread pool
 
         Returns
         ----------
@@ -105,7 +167,7 @@ class ERA5ExporterPOS(BaseExporter):
         if months is None:
             months = list(range(1, 12 + 1))
 
-        output_files = []
+        downloads = []
         for year, month in product(years, months):
             target_key = f"{year}/{month:02d}/data/{variable}.nc"
 
@@ -116,21 +178,18 @@ class ERA5ExporterPOS(BaseExporter):
             if target_output.exists():
                 print(f"{target_output} already exists! Skipping")
                 continue
-
-            try:
-                self.client.download_file(
-                    self.era5_bucket, target_key, str(target_output)
-                )
-                output_files.append(target_output)
-                print(f"Exported {target_key} to {target_folder}")
-            except botocore.exceptions.ClientError as e:  # type: ignore
-                if e.response["Error"]["Code"] == "404":
-                    possible_variables = self.get_variables(year, month)
-                    possible_variables_str = "\n".join(possible_variables)
-                    warnings.warn(
-                        f"Key does not exist! "
-                        f"Possible variables are: {possible_variables_str}"
+            downloads.append((year, month, target_key, target_output))
+
+        if n_parallel_requests > 1:
+            # boto3 clients are thread safe, so the workers share a client whose
+            # connection pool is sized for all of their download threads
+            client = self._make_client(n_parallel_requests)
+            with ThreadPoolExecutor(max_workers=n_parallel_requests) as executor:
+                output_files = list(
+                    executor.map(
+                        lambda args: self._export_file(*args, client=client), downloads
                     )
-                else:
-                    raise e
-        return output_files
+                )
+        else:
+            output_files = [self._export_file(*args) for args in downloads]
+        return [f for f in output_files if f is not None]
@@ -2,7 +2,7 @@ from pathlib import Path
 import xarray as xr
 import numpy as np
 
-from typing import List, Optional, Union, Tuple
+from typing import Any, Dict, List, Optional, Union, Tuple
 
 from ..utils import Region, region_lookup
 from .utils import select_bounding_box
@@ -43,6 +43,10 @@ class BasePreProcessor:
         self.raw_folder = self.data_folder / "raw"
         self.preprocessed_folder = self.data_folder / "interim"
 
+        # regridders are cached by grid, so that the weights are only
+        # calculated once for all the files being preprocessed
+        self._regridders: Dict[Tuple, Any] = {}
+
         if not self.preprocessed_folder.exists():
             self.preprocessed_folder.mkdir(exist_ok=True, parents=True)
 
@@ -103,6 +107,12 @@ class BasePreProcessor:
             The reference dataset, onto which `ds` will be regridded
         method: str, {'bilinear', 'conservative', 'nearest_s2d', 'nearest_d2s', 'patch'}
             The method applied for the regridding
+        reuse_weights: bool = False
+            If True, the weight file is saved with a descriptive name and loaded (rather
+            than recalculated) if it already exists. Within one preprocessor, regridders
+            are always reused for datasets on the same grid
+        clean: bool = False
+            If True, the weight file is deleted even if reuse_weights is True
         """
 
         assert ("lat" in reference_ds.dims) & (
@@ -125,51 +135,82 @@ class BasePreProcessor:
 
         # create the grid you want to convert TO (from reference_ds)
         ds_out = xr.Dataset(
-            {"lat": (["lat"], reference_ds.lat), "lon": (["lon"], reference_ds.lon)}
+            {
+                "lat": (["lat"], reference_ds.lat.values),
+                "lon": (["lon"], reference_ds.lon.values),
+            }
         )
 
         shape_in = len(ds.lat), len(ds.lon)
         shape_out = len(reference_ds.lat), len(reference_ds.lon)
-        # unique id so when parallel process doesn't write to same file
-        uid = f"{np.random.rand(1)[0]:.2f}"
-
-        # The weight file should be deleted by regridder.clean_weight_files(), but in case
-        # something goes wrong and its not, lets use a descriptive filename
-        if reuse_weights:
-            # if not running in parallel can save time by reusing weights
-            filename = f"{method}_{shape_in[0]}x{shape_in[1]}_\
-            {shape_out[0]}x{shape_out[1]}.nc".replace(
-                " ", ""
-            )
-        else:
-            filename = f"{method}_{shape_in[0]}x{shape_in[1]}_\
-            {shape_out[0]}x{shape_out[1]}_{uid}.nc".replace(
-                " ", ""
-            )
-        savedir = self.preprocessed_folder / filename
 
-        regridder = xesmf.Regridder(  # type: ignore
-            ds, ds_out, method, filename=str(savedir), reuse_weights=False
-        )
+        regridder_key = (method, self._grid_id(ds), self._grid_id(reference_ds))
+        regridder = self._regridders.get(regridder_key)
+        if regridder is None:
+            # unique id so when parallel process doesn't write to same file
+            uid = f"{np.random.rand(1)[0]:.2f}"
+
+            # The weight file is deleted once the regridder is built, but in case
+            # something goes wrong and its not, lets use a descriptive filename
+            if reuse_weights:
+                # if not running in parallel can save time by reusing weights
+                filename = f"{method}_{shape_in[0]}x{shape_in[1]}_\
+                {shape_out[0]}x{shape_out[1]}.nc".replace(
+                    " ", ""
+                )
+            else:
+                filename = f"{method}_{shape_in[0]}x{shape_in[1]}_\
+                {shape_out[0]}x{shape_out[1]}_{uid}.nc".replace(
+                    " ", ""
+                )
+            savedir = self.preprocessed_folder / filename
+
+            regridder = xesmf.Regridder(  # type: ignore
+                ds,
+                ds_out,
+                method,
+                filename=str(savedir),
+                reuse_weights=reuse_weights and savedir.exists(),
+            )
+            # the regridder holds the weights in memory, so the file is only
+            # kept if it is going to be reused by another preprocessor
+            if (clean or not reuse_weights) and savedir.exists():
+                savedir.unlink()
+            self._regridders[regridder_key] = regridder
 
         variables = [v for v in ds.data_vars]
-        output_dict = {}
-        for var in variables:
-            print(f"- regridding var {var} -")
-            output_dict[var] = regridder(ds[var])
-        ds = xr.Dataset(output_dict)
+        if len({ds[var].dims for var in variables}) == 1:
+            # the variables share their dimensions, so they can be stacked
+            # and regridded with a single call to the regridder
+            print(f"- regridding vars {variables} -")
+            ds = regridder(ds[variables].to_array(dim="variable")).to_dataset(
+                dim="variable"
+            )
+        else:
+            output_dict = {}
+            for var in variables:
+                print(f"- regridding var {var} -")
+                output_dict[var] = regridder(ds[var])
+            ds = xr.Dataset(output_dict)
 
         # print(
         #     f"Regridded from {(regridder.Ny_in, regridder.Nx_in)} "
         #     f"to {(regridder.Ny_out, regridder.Nx_out)}"
         # )
 
-        if clean:
-            # TODO: fix this as no longer an attribute of regridder objects
-            regridder.clean_weight_file()
-
         return ds
 
+    @staticmethod
+    def _grid_id(ds: xr.Dataset) -> Tuple:
+        """An identifier for the (lat, lon) grid of ds. The coordinates are 1D,
+        so their exact values are used; grids with the same extent and size
+        but different spacings need different regridders
+        """
+        return tuple(
+            (ds[coord].values.dtype.str, ds[coord].values.tobytes())
+            for coord in ["lat", "lon"]
+        )
+
     @staticmethod
     def load_reference_grid(path_to_grid: Path) -> xr.Dataset:
         """Since the regridder only needs to the lat and lon values,
@@ -180,14 +180,15 @@ class BokuNDVIPreprocessor(BasePreProcessor):
         # 1. read in the dataset
         ds = xr.open_dataset(netcdf_filepath)
 
+        # 2. chop out EastAfrica. This happens before the new dataarray
+        # is created so that only the subset is read from disk
+        if subset_str is not None:
+            ds = self.chop_roi(ds, subset_str)
+
         # assign time stamp
         timestamp = pd.to_datetime(self._parse_time_from_filename(netcdf_filepath.name))
         ds = self.create_new_dataarray(ds, timestamp)
 
-        # 2. chop out EastAfrica
-        if subset_str is not None:
-            ds = self.chop_roi(ds, subset_str)
-
         # 3. regrid
         if regrid is not None:
             ds = self.regrid(ds, regrid)
@@ -1,13 +1,13 @@
 from pathlib import Path
+from collections import defaultdict
 from functools import partial
 import xarray as xr
 import multiprocessing
 from shutil import rmtree
 import re
-import numpy as np
 import pandas as pd
 
-from typing import Optional, List, Tuple
+from typing import DefaultDict, Optional, List, Tuple
 
 from .base import BasePreProcessor
 from ..utils import get_modal_value_across_time
@@ -259,8 +259,8 @@ class ERA5MonthlyMeanPreprocessor(BasePreProcessor):
         : variable: str
             the variable in `ds` that we want to one hot encode.
         """
-        assert all(
-            np.isin(["code", "label_text"], legend.columns)
+        assert {"code", "label_text"} <= set(
+            legend.columns
         ), "Need code / label_text columns in legend"
         assert variable in list(
             ds.data_vars
@@ -294,17 +294,14 @@ class ERA5HourlyPreprocessor(ERA5MonthlyMeanPreprocessor):
         dynamic_filepaths = self.get_filepaths("interim", filter_type="dynamic")
         if len(dynamic_filepaths) > 0:
             _country_str = f"_{subset_str}.nc"  # '_[a-z]*.nc'
-            variables = [
-                re.sub(_country_str, "", p.name[8:]) for p in dynamic_filepaths
-            ]
+            # group the filepaths by variable in a single pass
+            variable_fpaths: DefaultDict[str, List[Path]] = defaultdict(list)
+            for p in dynamic_filepaths:
+                variable_fpaths[re.sub(_country_str, "", p.name[8:])].append(p)
 
             # all_dyn_ds = []
-            for variable in np.unique(variables):
-                _dyn_fpaths = [
-                    p
-                    for p in dynamic_filepaths
-                    if variable == re.sub(_country_str, "", p.name[8:])
-                ]
+            for variable in sorted(variable_fpaths):
+                _dyn_fpaths = variable_fpaths[variable]
                 variable = "_".join(variable.split("_")[-2:])
                 variable = f"hourly_{variable}"
                 _ds_dyn = xr.open_mfdataset(_dyn_fpaths)
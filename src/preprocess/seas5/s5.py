@@ -133,9 +133,7 @@ class S5Preprocessor(BasePreProcessor):
 
         # 5. regrid (one variable at a time)
         if regrid is not None:
-            assert all(
-                np.isin(["lat", "lon"], [c for c in ds.coords])
-            ), f"\
+            assert {"lat", "lon"} <= set(ds.coords), f"\
             Expecting `lat` `lon` to be in ds. dims : {[c for c in ds.coords]}"
 
             # regrid each variable individually
@@ -347,11 +345,8 @@ class S5Preprocessor(BasePreProcessor):
         self, ds: xr.Dataset, tstep_coord_name: str = "months_ahead"
     ) -> xr.Dataset:
         """Drop the forecast_horizon & initialisation_date variables"""
-        assert all(
-            np.isin(
-                ["initialisation_date", "forecast_horizon", tstep_coord_name],
-                [c for c in ds.coords],
-            )
+        assert {"initialisation_date", "forecast_horizon", tstep_coord_name} <= set(
+            ds.coords
         ), (
             "Expecting to have "
             f"initialisation_date forecast_horizon {tstep_coord_name} in ds.coords"
@@ -51,23 +51,28 @@ def select_bounding_box(
     )
 
     if "latitude" in dims and "longitude" in dims:
-        ds_slice = ds.sel(
-            latitude=slice(latmax, latmin) if inverse_lat else slice(latmin, latmax),
-            longitude=slice(lonmax, lonmin) if inverse_lon else slice(lonmin, lonmax),
-        )
+        lat, lon = "latitude", "longitude"
     elif "lat" in dims and "lon" in dims:
-        ds_slice = ds.sel(
-            lat=slice(latmax, latmin) if inverse_lat else slice(latmin, latmax),
-            lon=slice(lonmax, lonmin) if inverse_lon else slice(lonmin, lonmax),
-        )
+        lat, lon = "lat", "lon"
     else:
         raise ValueError(
             f"Your `xr.ds` does not have lon / longitude in the "
             f"dimensions. Currently: {[dim for dim in ds.dims.keys()]}"
         )
 
+    if _region_covers(ds, region, lat, lon):
+        # the selection would return the whole dataset
+        return ds
+
+    ds_slice = ds.sel(
+        {
+            lat: slice(latmax, latmin) if inverse_lat else slice(latmin, latmax),
+            lon: slice(lonmax, lonmin) if inverse_lon else slice(lonmin, lonmax),
+        }
+    )
+
     for variable in variables:
-        assert ds_slice[variable].values.size != 0, (
+        assert ds_slice[variable].size != 0, (
             f"Your slice has returned NO values. "
             f"Sometimes this means that the latmin, latmax are the wrong way around. "
             f"Try switching the order of latmin, latmax"
@@ -75,6 +80,21 @@ def select_bounding_box(
     return ds_slice
 
 
+def _region_covers(ds: xr.Dataset, region: Region, lat: str, lon: str) -> bool:
+    """Whether the region contains every (lat, lon) point of ds, in which case
+    selecting the region from ds is a no-op
+    """
+    if (ds[lat].size == 0) or (ds[lon].size == 0):
+        return False
+    lat_vals, lon_vals = ds[lat].values, ds[lon].values
+    return (
+        (min(region.latmin, region.latmax) <= lat_vals.min())
+        & (lat_vals.max() <= max(region.latmin, region.latmax))
+        & (min(region.lonmin, region.lonmax) <= lon_vals.min())
+        & (lon_vals.max() <= max(region.lonmin, region.lonmax))
+    )
+
+
 class SHPtoXarray:
     def __init__(self):
         print(
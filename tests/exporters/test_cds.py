@@ -260,6 +260,35 @@ class TestCDSExporter:
         for file in expected_paths:
             assert file in output_paths, f"{file} not in the output paths!"
 
+    @pytest.mark.xfail(reason="cdsapi may not be installed")
+    @patch("cdsapi.Client")
+    def test_break_up_parallel(self, cdsapi_mock, tmp_path):
+        cdsapi_mock.return_value = Mock()
+        exporter = ERA5Exporter(tmp_path)
+
+        user_defined_arguments = {"year": [2019, 2018], "month": [4, 5]}
+
+        output_paths = exporter.export(
+            "precipitation",
+            dataset="era5",
+            granularity="hourly",
+            selection_request=user_defined_arguments,
+            break_up=True,
+            n_parallel_requests=2,
+        )
+
+        raw_folder = tmp_path / "raw"
+        expected_paths = [
+            raw_folder / "era5/precipitation/2019/04_05.nc",
+            raw_folder / "era5/precipitation/2018/04_05.nc",
+        ]
+
+        assert output_paths == expected_paths, (
+            f"Expected the parallel export to return {expected_paths}, "
+            f"got {output_paths}"
+        )
+        assert cdsapi_mock.return_value.retrieve.call_count == len(expected_paths)
+
     def test_correct_inputs(self):
 
         user_defined_arguments = {"year": 2019, "day": 1, "month": 5, "time": "00:00"}
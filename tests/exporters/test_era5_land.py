@@ -254,3 +254,32 @@ class TestERA5LandExporter:
 
         for file in expected_paths:
             assert file in output_paths, f"{file} not in the output paths!"
+
+    @pytest.mark.xfail(reason="cdsapi may not be installed")
+    @patch("cdsapi.Client")
+    def test_break_up_parallel(self, cdsapi_mock, tmp_path):
+        cdsapi_mock.return_value = Mock()
+        exporter = ERA5LandExporter(tmp_path)
+
+        user_defined_arguments = {"year": [2019, 2018], "month": [4, 5]}
+
+        output_paths = exporter.export(
+            "snowmelt",
+            selection_request=user_defined_arguments,
+            break_up="monthly",
+            n_parallel_requests=2,
+        )
+
+        raw_folder = tmp_path / "raw/reanalysis-era5-land-monthly-means/snowmelt"
+        expected_paths = [
+            raw_folder / "2019/04.nc",
+            raw_folder / "2019/05.nc",
+            raw_folder / "2018/04.nc",
+            raw_folder / "2018/05.nc",
+        ]
+
+        assert output_paths == expected_paths, (
+            f"Expected the parallel export to return {expected_paths}, "
+            f"got {output_paths}"
+        )
+        assert cdsapi_mock.return_value.retrieve.call_count == len(expected_paths)
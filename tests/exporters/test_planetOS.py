@@ -1,4 +1,5 @@
 import boto3
+import pytest
 from moto import mock_s3
 
 from itertools import product
@@ -58,7 +59,21 @@ class TestERA5ExporterPOS:
             ), f"Expected to get variable {variable} but did not"
 
     @mock_s3
-    def test_export(self, tmp_path):
+    def test_client_connection_pool(self, tmp_path):
+        exporter = ERA5ExporterPOS(tmp_path)
+        max_concurrency = exporter.transfer_config.max_concurrency
+
+        client = exporter._make_client(n_parallel_requests=4)
+        max_pool_connections = client.meta.config.max_pool_connections
+
+        assert max_pool_connections == 4 * max_concurrency, (
+            f"Expected a connection pool of {4 * max_concurrency} for 4 parallel "
+            f"requests, got {max_pool_connections}"
+        )
+
+    @pytest.mark.parametrize("n_parallel_requests", [1, 4])
+    @mock_s3
+    def test_export(self, tmp_path, n_parallel_requests):
         # setup our fake bucket
         era5_bucket = "era5-pds"
         conn = boto3.client("s3")
@@ -84,7 +99,9 @@ class TestERA5ExporterPOS:
             conn.put_object(Bucket=era5_bucket, Key=key, Body="")
 
         exporter = ERA5ExporterPOS(tmp_path)
-        downloaded_files = exporter.export(variable)
+        downloaded_files = exporter.export(
+            variable, n_parallel_requests=n_parallel_requests
+        )
 
         for file in expected_files:
             assert file.exists(), f"Expected {file} to be downloaded"
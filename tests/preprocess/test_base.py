@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import patch
 
 from ..utils import _make_dataset
 
@@ -61,6 +62,48 @@ class TestBase:
             processor.preprocessed_folder / weight_filename
         ).exists() is False, f"Regridder weight file not deleted!"
 
+    def test_regridder_reuse_weights(self, tmp_path):
+        reference_ds, _, _ = _make_dataset((10, 10))
+        target_ds, _, _ = _make_dataset((20, 20))
+
+        processor = BasePreProcessor(tmp_path)
+        processor.regrid(target_ds, reference_ds, reuse_weights=True)
+        weight_filename = "nearest_s2d_20x20_10x10.nc"
+        assert (
+            processor.preprocessed_folder / weight_filename
+        ).exists(), f"Regridder weight file not saved for reuse!"
+
+    @patch("src.preprocess.base.xesmf")
+    def test_regridder_cache(self, xesmf_mock, tmp_path):
+        reference_ds, _, _ = _make_dataset((10, 10))
+        target_ds, _, _ = _make_dataset((20, 20))
+
+        processor = BasePreProcessor(tmp_path)
+        processor.regrid(target_ds, reference_ds)
+        processor.regrid(target_ds, reference_ds)
+
+        assert (
+            xesmf_mock.Regridder.call_count == 1
+        ), "Expected the regridder to be reused for the same grids"
+
+    @patch("src.preprocess.base.xesmf")
+    def test_regridder_cache_spacing(self, xesmf_mock, tmp_path):
+        reference_ds, _, _ = _make_dataset((10, 10))
+        target_ds, _, _ = _make_dataset((20, 20))
+
+        # same size and extent, but unevenly spaced latitudes
+        uneven_lat = target_ds.lat.values.copy()
+        uneven_lat[1:-1] = uneven_lat[1:-1] + 0.01
+        uneven_ds = target_ds.assign_coords(lat=uneven_lat)
+
+        processor = BasePreProcessor(tmp_path)
+        processor.regrid(target_ds, reference_ds)
+        processor.regrid(uneven_ds, reference_ds)
+
+        assert (
+            xesmf_mock.Regridder.call_count == 2
+        ), "Expected a new regridder for a grid with different spacing"
+
     def test_load_regridder(self, tmp_path):
 
         test_dataset, _, _ = _make_dataset(size=(10, 10))
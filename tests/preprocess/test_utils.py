@@ -42,6 +42,21 @@ class TestSelectBoundingBox:
             max(subset.lon.values) < 0
         ), f"Got a longitude greater than 0, {max(subset.lon.values)}"
 
+    def test_selection_covering_region(self):
+        size = (100, 100)
+        ds, (lonmin, lonmax), (latmin, latmax) = _make_dataset(size)
+
+        larger_region = Region(
+            name="larger",
+            lonmin=lonmin - 1,
+            lonmax=lonmax + 1,
+            latmin=latmin - 1,
+            latmax=latmax + 1,
+        )
+        subset = select_bounding_box(ds, larger_region)
+
+        assert subset is ds, "Expected the whole dataset to be returned unchanged"
+
 
 class TestSHPtoXarray:
     @pytest.mark.xfail(reason="geopandas not part of the testing environment")